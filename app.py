@@ -15,15 +15,24 @@ This module implements a production-ready Flask application with:
 - Input validation
 - Logging configuration
 - Health monitoring
+- Response caching for read endpoints
+- Fast JSON serialization via orjson
 - RESTful API endpoints
 - Modular design patterns
 """
 
-from flask import Flask, jsonify, request
-from datetime import datetime
+from flask import Flask, Response, request
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.exceptions import HTTPException
+from flask_caching import Cache
+import itertools
 import logging
 import os
-from typing import Dict, List, Optional, Union
+import sys
+import threading
+import time
+import orjson
+from typing import Dict, FrozenSet, List, Optional, Tuple, Union
 from http import HTTPStatus
 
 # Configure logging with more detailed format
@@ -37,6 +46,88 @@ logger = logging.getLogger(__name__)
 # Type aliases for better code readability
 TaskType = Dict[str, Union[int, str]]
 TaskListType = List[TaskType]
+TaskStoreType = Dict[int, TaskType]
+
+# Task status lookup tables: name -> code for validation, code -> canonical name
+_STATUS_NAMES: Tuple[str, ...] = ('pending', 'in_progress', 'completed')
+_STATUS_CODES: Dict[str, int] = {name: code for code, name in enumerate(_STATUS_NAMES)}
+
+# Second-resolution timestamp prefix, reformatted at most once per second
+_iso_second_cache: Tuple[int, str] = (-1, '')
+
+def _now_iso() -> str:
+    """
+    Return the current local time as an ISO 8601 string.
+    
+    Matches datetime.now().isoformat(), except that microseconds are always
+    included, without building a datetime object; the date/time prefix is
+    cached and only reformatted when the second changes.
+    
+    Returns:
+        Timestamp string like '2025-01-31T12:00:00.000000'
+    """
+    global _iso_second_cache
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_second, prefix = _iso_second_cache
+    if seconds != cached_second:
+        prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(seconds))
+        _iso_second_cache = (seconds, prefix)
+    return f"{prefix}.{nanos // 1000:06d}"
+
+def ojsonify(payload: dict, status: int = HTTPStatus.OK) -> Response:
+    """
+    Build a JSON response using orjson for fast serialization.
+    
+    Args:
+        payload: JSON-serializable response body
+        status: HTTP status code (default: 200)
+        
+    Returns:
+        Response with an application/json body
+    """
+    return Response(orjson.dumps(payload), status=status, mimetype='application/json')
+
+# Fixed error bodies, encoded once at import time
+_ERR_500 = orjson.dumps({'success': False, 'error': 'Internal server error'})
+_ERR_TASK_NOT_FOUND = orjson.dumps({'success': False, 'error': 'Task not found'})
+_ERR_ENDPOINT_NOT_FOUND = orjson.dumps({'success': False, 'error': 'Endpoint not found'})
+_ERR_NOT_JSON = orjson.dumps({'success': False, 'error': 'Content-Type must be application/json'})
+_ERR_NO_DATA = orjson.dumps({'success': False, 'error': 'No data provided'})
+_ERR_NOT_OBJECT = orjson.dumps({'success': False, 'error': 'Request body must be a JSON object'})
+_ERR_STATUS_REQUIRED = orjson.dumps({'success': False, 'error': 'Status is required'})
+_ERR_BAD_PAGINATION = orjson.dumps({
+    'success': False,
+    'error': 'limit and offset must be non-negative integers'
+})
+
+def error_response(body: bytes, status: int) -> Response:
+    """
+    Build a JSON error response from a pre-encoded body.
+    
+    Args:
+        body: Pre-encoded JSON error payload
+        status: HTTP status code
+        
+    Returns:
+        Response with an application/json body
+    """
+    return Response(body, status=status, mimetype='application/json')
+
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+    
+    Routes request body parsing (request.get_json) and any Flask-level JSON
+    serialization through orjson's native encoder and decoder.
+    """
+    
+    def dumps(self, obj, **kwargs) -> str:
+        """Serialize obj to a JSON string, falling back to Flask's default hook."""
+        return orjson.dumps(obj, default=self.default).decode()
+    
+    def loads(self, s, **kwargs):
+        """Deserialize a JSON string or bytes payload."""
+        return orjson.loads(s)
 
 class TaskManager:
     """
@@ -46,16 +137,21 @@ class TaskManager:
     and status management. It implements validation and logging for all operations.
     
     Attributes:
-        tasks (List[Dict]): List storing all tasks
+        tasks (Dict[int, Dict]): Tasks keyed by ID, in insertion order
         task_id_counter (int): Auto-incrementing counter for task IDs
+    
+    Mutations that touch the ID counter or remove tasks are serialized with
+    an internal lock so threaded/async workers cannot race; reads stay
+    lock-free since single dict operations are atomic under the GIL.
     """
     
-    VALID_STATUSES = ['pending', 'in_progress', 'completed']
+    VALID_STATUSES: FrozenSet[str] = frozenset(_STATUS_NAMES)
     
     def __init__(self) -> None:
-        """Initialize TaskManager with empty task list."""
-        self.tasks: TaskListType = []
+        """Initialize TaskManager with empty task store."""
+        self.tasks: TaskStoreType = {}
         self.task_id_counter: int = 1
+        self._lock = threading.Lock()
         logger.info("TaskManager initialized successfully")
     
     def create_task(self, title: str, description: str = "") -> TaskType:
@@ -70,24 +166,100 @@ class TaskManager:
             Dict containing the created task
             
         Raises:
-            ValueError: If title is empty or invalid
+            ValueError: If title is empty or invalid, or description is not a string
+        """
+        self._validate_title(title)
+        self._validate_description(description)
+        
+        with self._lock:
+            task = self._add_task(title, description, _now_iso())
+        logger.info("Task created successfully with ID: %s", task['id'])
+        return task
+    
+    def create_tasks(self, entries: List[Dict[str, str]]) -> TaskListType:
+        """
+        Create several tasks in one call with a shared timestamp.
+        
+        All entries are validated before any task is stored, so a batch is
+        either created in full or not at all.
+        
+        Args:
+            entries: List of dicts each holding a 'title' and optional 'description'
+            
+        Returns:
+            List of created tasks, in input order
+            
+        Raises:
+            ValueError: If entries is not a non-empty list of dicts, or any entry is invalid
+        """
+        if not entries or not isinstance(entries, list) or \
+                not all(isinstance(entry, dict) for entry in entries):
+            logger.error("Invalid task batch provided")
+            raise ValueError("Tasks must be a non-empty list of task objects")
+        
+        for entry in entries:
+            self._validate_title(entry.get('title'))
+            self._validate_description(entry.get('description', ''))
+        
+        now = _now_iso()
+        with self._lock:
+            tasks = [
+                self._add_task(entry['title'], entry.get('description', ''), now)
+                for entry in entries
+            ]
+        logger.info("Batch of %s tasks created, IDs %s-%s",
+                    len(tasks), tasks[0]['id'], tasks[-1]['id'])
+        return tasks
+    
+    @staticmethod
+    def _validate_title(title: str) -> None:
+        """
+        Validate a task title.
+        
+        Raises:
+            ValueError: If title is empty or not a string
         """
         if not title or not isinstance(title, str):
             logger.error("Invalid task title provided")
             raise ValueError("Task title must be a non-empty string")
+    
+    @staticmethod
+    def _validate_description(description: str) -> None:
+        """
+        Validate a task description.
+        
+        Raises:
+            ValueError: If description is not a string
+        """
+        if not isinstance(description, str):
+            logger.error("Invalid task description provided")
+            raise ValueError("Task description must be a string")
+    
+    def _add_task(self, title: str, description: str, now: str) -> TaskType:
+        """
+        Store a new pending task under the next ID.
         
+        Callers must hold self._lock.
+        
+        Args:
+            title: Validated task title
+            description: Task description
+            now: ISO timestamp used for both created_at and updated_at
+            
+        Returns:
+            Dict containing the stored task
+        """
         task: TaskType = {
             'id': self.task_id_counter,
             'title': title.strip(),
             'description': description.strip(),
             'status': 'pending',
-            'created_at': datetime.now().isoformat(),
-            'updated_at': datetime.now().isoformat()
+            'created_at': now,
+            'updated_at': now
         }
         
-        self.tasks.append(task)
+        self.tasks[task['id']] = task
         self.task_id_counter += 1
-        logger.info(f"Task created successfully with ID: {task['id']}")
         return task
     
     def get_task(self, task_id: int) -> Optional[TaskType]:
@@ -100,22 +272,40 @@ class TaskManager:
         Returns:
             Task dictionary if found, None otherwise
         """
-        task = next((task for task in self.tasks if task['id'] == task_id), None)
+        task = self.tasks.get(task_id)
         if task:
-            logger.debug(f"Task retrieved: ID {task_id}")
+            logger.debug("Task retrieved: ID %s", task_id)
         else:
-            logger.debug(f"Task not found: ID {task_id}")
+            logger.debug("Task not found: ID %s", task_id)
         return task
     
-    def get_all_tasks(self) -> TaskListType:
+    def get_all_tasks(self, limit: Optional[int] = None, offset: int = 0) -> TaskListType:
         """
-        Retrieve all tasks.
+        Retrieve tasks in creation order, optionally paginated.
         
+        Only the requested window is copied out of the store. Bounds above
+        sys.maxsize are clamped, since the store can never be that large.
+        
+        Args:
+            limit: Maximum number of tasks to return (default: no limit)
+            offset: Number of tasks to skip from the start (default: 0)
+            
         Returns:
-            List of all tasks
+            List of tasks in the requested window
+            
+        Raises:
+            ValueError: If limit or offset is negative
         """
-        logger.debug(f"Returning all tasks. Count: {len(self.tasks)}")
-        return self.tasks
+        if offset < 0 or (limit is not None and limit < 0):
+            logger.error("Invalid pagination provided: limit=%s offset=%s", limit, offset)
+            raise ValueError("limit and offset must be non-negative integers")
+        
+        logger.debug("Returning tasks. Count: %s, limit: %s, offset: %s",
+                     len(self.tasks), limit, offset)
+        if limit is None and offset == 0:
+            return list(self.tasks.values())
+        stop = None if limit is None else min(offset + limit, sys.maxsize)
+        return list(itertools.islice(self.tasks.values(), min(offset, sys.maxsize), stop))
     
     def update_task_status(self, task_id: int, status: str) -> Optional[TaskType]:
         """
@@ -131,18 +321,20 @@ class TaskManager:
         Raises:
             ValueError: If status is invalid
         """
-        if status not in self.VALID_STATUSES:
-            logger.error(f"Invalid status provided: {status}")
-            raise ValueError(f"Status must be one of: {self.VALID_STATUSES}")
+        code = _STATUS_CODES.get(status) if isinstance(status, str) else None
+        if code is None:
+            logger.error("Invalid status provided: %s", status)
+            raise ValueError(f"Status must be one of: {sorted(self.VALID_STATUSES)}")
         
-        task = self.get_task(task_id)
-        if not task:
-            logger.warning(f"Attempt to update non-existent task: ID {task_id}")
+        task = self.tasks.get(task_id)
+        if task is None:
+            logger.warning("Attempt to update non-existent task: ID %s", task_id)
             return None
         
-        task['status'] = status
-        task['updated_at'] = datetime.now().isoformat()
-        logger.info(f"Task {task_id} status updated to {status}")
+        # Store the shared canonical string, not the per-request copy
+        task['status'] = _STATUS_NAMES[code]
+        task['updated_at'] = _now_iso()
+        logger.info("Task %s status updated to %s", task_id, status)
         return task
     
     def delete_task(self, task_id: int) -> bool:
@@ -155,12 +347,12 @@ class TaskManager:
         Returns:
             bool: True if task was deleted, False if not found
         """
-        task = self.get_task(task_id)
-        if task:
-            self.tasks.remove(task)
-            logger.info(f"Task {task_id} deleted successfully")
+        with self._lock:
+            deleted = self.tasks.pop(task_id, None) is not None
+        if deleted:
+            logger.info("Task %s deleted successfully", task_id)
             return True
-        logger.warning(f"Attempt to delete non-existent task: ID {task_id}")
+        logger.warning("Attempt to delete non-existent task: ID %s", task_id)
         return False
 
 def create_app() -> Flask:
@@ -174,90 +366,131 @@ def create_app() -> Flask:
         Configured Flask application instance
     """
     app = Flask(__name__)
+    app.json = ORJSONProvider(app)
+    cache = Cache(app, config={'CACHE_TYPE': 'SimpleCache', 'CACHE_DEFAULT_TIMEOUT': 30})
     task_manager = TaskManager()
+    app.extensions['task_manager'] = task_manager
+    
+    def invalidate_task_cache(task_id: int) -> None:
+        """Drop cached read responses affected by a change to the given task."""
+        cache.delete('all_tasks')
+        cache.delete_memoized(get_task, task_id)
     
     @app.route('/health', methods=['GET'])
-    def health_check() -> tuple[dict, int]:
+    def health_check() -> Response:
         """
         Health check endpoint for monitoring.
         
         Returns:
-            Tuple of (response_data, status_code)
+            JSON response with the matching HTTP status
         """
-        return jsonify({
+        return ojsonify({
             'status': 'healthy',
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': _now_iso(),
             'version': '1.0.0',
             'environment': os.getenv('FLASK_ENV', 'production')
-        }), HTTPStatus.OK
+        }, HTTPStatus.OK)
     
     @app.route('/tasks', methods=['GET'])
-    def get_tasks() -> tuple[dict, int]:
+    @cache.cached(timeout=10, key_prefix='all_tasks', unless=lambda: bool(request.args))
+    def get_tasks() -> Response:
         """
         Get all tasks endpoint.
         
+        Supports optional ?limit= and ?offset= query parameters for pagination.
+        Only the unpaginated listing is cached.
+        
         Returns:
-            Tuple of (response_data, status_code)
+            JSON response with the matching HTTP status
         """
         try:
-            tasks = task_manager.get_all_tasks()
-            return jsonify({
-                'success': True,
-                'tasks': tasks,
-                'count': len(tasks)
-            }), HTTPStatus.OK
-        except Exception as e:
-            logger.exception("Error retrieving tasks")
-            return jsonify({
-                'success': False,
-                'error': 'Internal server error'
-            }), HTTPStatus.INTERNAL_SERVER_ERROR
+            limit = request.args.get('limit')
+            limit = int(limit) if limit is not None else None
+            offset = int(request.args.get('offset', 0))
+            tasks = task_manager.get_all_tasks(limit=limit, offset=offset)
+        except ValueError:
+            return error_response(_ERR_BAD_PAGINATION, HTTPStatus.BAD_REQUEST)
+        
+        return ojsonify({
+            'success': True,
+            'tasks': tasks,
+            'count': len(tasks),
+            'total': len(task_manager.tasks)
+        }, HTTPStatus.OK)
     
     @app.route('/tasks', methods=['POST'])
-    def create_task() -> tuple[dict, int]:
+    def create_task() -> Response:
         """
         Create new task endpoint.
         
         Returns:
-            Tuple of (response_data, status_code)
+            JSON response with the matching HTTP status
         """
+        if not request.is_json:
+            return error_response(_ERR_NOT_JSON, HTTPStatus.BAD_REQUEST)
+        
+        data = request.get_json()
+        if not data:
+            return error_response(_ERR_NO_DATA, HTTPStatus.BAD_REQUEST)
+        if not isinstance(data, dict):
+            return error_response(_ERR_NOT_OBJECT, HTTPStatus.BAD_REQUEST)
+        
+        title = data.get('title')
+        description = data.get('description', '')
+        
         try:
-            if not request.is_json:
-                return jsonify({
-                    'success': False,
-                    'error': 'Content-Type must be application/json'
-                }), HTTPStatus.BAD_REQUEST
-            
-            data = request.get_json()
-            if not data:
-                return jsonify({
-                    'success': False,
-                    'error': 'No data provided'
-                }), HTTPStatus.BAD_REQUEST
-            
-            title = data.get('title')
-            description = data.get('description', '')
-            
             task = task_manager.create_task(title, description)
-            return jsonify({
-                'success': True,
-                'task': task
-            }), HTTPStatus.CREATED
-        
         except ValueError as e:
-            return jsonify({
+            return ojsonify({
                 'success': False,
                 'error': str(e)
-            }), HTTPStatus.BAD_REQUEST
-        except Exception as e:
-            logger.exception("Error creating task")
-            return jsonify({
+            }, HTTPStatus.BAD_REQUEST)
+        
+        invalidate_task_cache(task['id'])
+        return ojsonify({
+            'success': True,
+            'task': task
+        }, HTTPStatus.CREATED)
+    
+    @app.route('/tasks/batch', methods=['POST'])
+    def create_tasks_batch() -> Response:
+        """
+        Create multiple tasks in a single request.
+        
+        Expects a body of the form {"tasks": [{"title": ..., "description": ...}, ...]}.
+        
+        Returns:
+            JSON response with the matching HTTP status
+        """
+        if not request.is_json:
+            return error_response(_ERR_NOT_JSON, HTTPStatus.BAD_REQUEST)
+        
+        data = request.get_json()
+        if not data:
+            return error_response(_ERR_NO_DATA, HTTPStatus.BAD_REQUEST)
+        if not isinstance(data, dict):
+            return error_response(_ERR_NOT_OBJECT, HTTPStatus.BAD_REQUEST)
+        
+        try:
+            tasks = task_manager.create_tasks(data.get('tasks'))
+        except ValueError as e:
+            return ojsonify({
                 'success': False,
-                'error': 'Internal server error'
-            }), HTTPStatus.INTERNAL_SERVER_ERROR
+                'error': str(e)
+            }, HTTPStatus.BAD_REQUEST)
+        
+        cache.delete('all_tasks')
+        for task in tasks:
+            cache.delete_memoized(get_task, task['id'])
+        return ojsonify({
+            'success': True,
+            'tasks': tasks,
+            'count': len(tasks)
+        }, HTTPStatus.CREATED)
     
     @app.route('/tasks/<int:task_id>', methods=['GET'])
-    def get_task(task_id: int) -> tuple[dict, int]:
+    @cache.memoize(10)
+    def get_task(task_id: int) -> Response:
         """
         Get specific task endpoint.
         
@@ -265,29 +498,19 @@ def create_app() -> Flask:
             task_id: Task identifier
             
         Returns:
-            Tuple of (response_data, status_code)
+            JSON response with the matching HTTP status
         """
-        try:
-            task = task_manager.get_task(task_id)
-            if not task:
-                return jsonify({
-                    'success': False,
-                    'error': 'Task not found'
-                }), HTTPStatus.NOT_FOUND
-            
-            return jsonify({
-                'success': True,
-                'task': task
-            }), HTTPStatus.OK
-        except Exception as e:
-            logger.exception(f"Error retrieving task {task_id}")
-            return jsonify({
-                'success': False,
-                'error': 'Internal server error'
-            }), HTTPStatus.INTERNAL_SERVER_ERROR
+        task = task_manager.get_task(task_id)
+        if not task:
+            return error_response(_ERR_TASK_NOT_FOUND, HTTPStatus.NOT_FOUND)
+        
+        return ojsonify({
+            'success': True,
+            'task': task
+        }, HTTPStatus.OK)
     
     @app.route('/tasks/<int:task_id>/status', methods=['PUT'])
-    def update_task_status(task_id: int) -> tuple[dict, int]:
+    def update_task_status(task_id: int) -> Response:
         """
         Update task status endpoint.
         
@@ -295,42 +518,33 @@ def create_app() -> Flask:
             task_id: Task identifier
             
         Returns:
-            Tuple of (response_data, status_code)
+            JSON response with the matching HTTP status
         """
+        data = request.get_json()
+        if data is not None and not isinstance(data, dict):
+            return error_response(_ERR_NOT_OBJECT, HTTPStatus.BAD_REQUEST)
+        if not data or 'status' not in data:
+            return error_response(_ERR_STATUS_REQUIRED, HTTPStatus.BAD_REQUEST)
+        
         try:
-            data = request.get_json()
-            if not data or 'status' not in data:
-                return jsonify({
-                    'success': False,
-                    'error': 'Status is required'
-                }), HTTPStatus.BAD_REQUEST
-            
             task = task_manager.update_task_status(task_id, data['status'])
-            if not task:
-                return jsonify({
-                    'success': False,
-                    'error': 'Task not found'
-                }), HTTPStatus.NOT_FOUND
-            
-            return jsonify({
-                'success': True,
-                'task': task
-            }), HTTPStatus.OK
-        
         except ValueError as e:
-            return jsonify({
+            return ojsonify({
                 'success': False,
                 'error': str(e)
-            }), HTTPStatus.BAD_REQUEST
-        except Exception as e:
-            logger.exception(f"Error updating task {task_id}")
-            return jsonify({
-                'success': False,
-                'error': 'Internal server error'
-            }), HTTPStatus.INTERNAL_SERVER_ERROR
+            }, HTTPStatus.BAD_REQUEST)
+        
+        if not task:
+            return error_response(_ERR_TASK_NOT_FOUND, HTTPStatus.NOT_FOUND)
+        
+        invalidate_task_cache(task_id)
+        return ojsonify({
+            'success': True,
+            'task': task
+        }, HTTPStatus.OK)
     
     @app.route('/tasks/<int:task_id>', methods=['DELETE'])
-    def delete_task(task_id: int) -> tuple[dict, int]:
+    def delete_task(task_id: int) -> Response:
         """
         Delete task endpoint.
         
@@ -338,54 +552,61 @@ def create_app() -> Flask:
             task_id: Task identifier
             
         Returns:
-            Tuple of (response_data, status_code)
+            JSON response with the matching HTTP status
         """
-        try:
-            success = task_manager.delete_task(task_id)
-            if not success:
-                return jsonify({
-                    'success': False,
-                    'error': 'Task not found'
-                }), HTTPStatus.NOT_FOUND
-            
-            return jsonify({
-                'success': True,
-                'message': f'Task {task_id} deleted successfully'
-            }), HTTPStatus.OK
-        except Exception as e:
-            logger.exception(f"Error deleting task {task_id}")
-            return jsonify({
-                'success': False,
-                'error': 'Internal server error'
-            }), HTTPStatus.INTERNAL_SERVER_ERROR
+        success = task_manager.delete_task(task_id)
+        if not success:
+            return error_response(_ERR_TASK_NOT_FOUND, HTTPStatus.NOT_FOUND)
+        
+        invalidate_task_cache(task_id)
+        return ojsonify({
+            'success': True,
+            'message': f'Task {task_id} deleted successfully'
+        }, HTTPStatus.OK)
     
     @app.errorhandler(404)
-    def not_found(error) -> tuple[dict, int]:
+    def not_found(error) -> Response:
         """Handle 404 errors."""
-        return jsonify({
-            'success': False,
-            'error': 'Endpoint not found'
-        }), HTTPStatus.NOT_FOUND
+        return error_response(_ERR_ENDPOINT_NOT_FOUND, HTTPStatus.NOT_FOUND)
     
     @app.errorhandler(500)
-    def internal_error(error) -> tuple[dict, int]:
+    def internal_error(error) -> Response:
         """Handle 500 errors."""
         logger.exception("Internal server error occurred")
-        return jsonify({
-            'success': False,
-            'error': 'Internal server error'
-        }), HTTPStatus.INTERNAL_SERVER_ERROR
+        return error_response(_ERR_500, HTTPStatus.INTERNAL_SERVER_ERROR)
+    
+    @app.errorhandler(Exception)
+    def unhandled_exception(error: Exception) -> Response:
+        """
+        Handle any exception not caught by an endpoint.
+        
+        HTTP errors (e.g. malformed JSON bodies, wrong methods) keep their
+        status code and headers such as Allow; anything else, including an
+        HTTPException without a code, is logged and reported as a 500.
+        """
+        if isinstance(error, HTTPException) and error.code is not None:
+            response = ojsonify({
+                'success': False,
+                'error': error.description
+            }, error.code)
+            response.headers.extend(
+                (key, value) for key, value in error.get_headers()
+                if key.lower() != 'content-type'
+            )
+            return response
+        logger.exception("Unhandled error processing %s %s", request.method, request.path)
+        return error_response(_ERR_500, HTTPStatus.INTERNAL_SERVER_ERROR)
     
     return app
 
 if __name__ == '__main__':
-    # Get port from environment variable with fallback to 8000
+    # Development server only; production is served by Gunicorn:
+    #   gunicorn -c gunicorn.conf.py 'app:create_app()'
     port = int(os.environ.get('PORT', 8000))
     
     # Create and run application
     app = create_app()
     
-    # Production-ready configuration
     app.run(
         host='0.0.0.0',
         port=port,
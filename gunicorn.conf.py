@@ -0,0 +1,41 @@
+"""
+Task Management System - Gunicorn Configuration
+-----------------------------------------------
+
+Production WSGI server settings for the Task Management System.
+
+Author: Uttam Thakur
+Version: 1.0.0
+License: MIT
+Created: 2025
+Updated: 2025
+
+Usage:
+    gunicorn -c gunicorn.conf.py 'app:create_app()'
+
+Note:
+    TaskManager and the response cache live in process memory, so every
+    worker holds its own independent task store and ID counter. The server
+    therefore runs a single worker by default and relies on the gevent
+    worker for concurrency. Only raise WEB_CONCURRENCY once task state has
+    moved to a shared backend (e.g. Redis or SQLite).
+"""
+
+import os
+
+# Server socket
+bind = f"0.0.0.0:{os.environ.get('PORT', 8000)}"
+
+# Worker processes (pre-forked). A single worker keeps the in-memory task
+# store consistent; gevent multiplexes many concurrent connections within it
+# and Gunicorn applies gevent's monkey patching itself.
+workers = int(os.environ.get('WEB_CONCURRENCY', 1))
+worker_class = 'gevent'
+worker_connections = 1000
+keepalive = 2
+timeout = 30
+
+# Logging to stdout/stderr for container log collection
+accesslog = '-'
+errorlog = '-'
+loglevel = 'info'
@@ -0,0 +1,115 @@
+"""
+Task Management System - Test Fixtures
+--------------------------------------
+
+Shared pytest fixtures for the Task Management System test suite.
+
+Author: Uttam Thakur
+Version: 1.0.0
+License: MIT
+Created: 2025
+Updated: 2025
+
+This module provides:
+- Session-scoped Flask application
+- Session-scoped test client
+- Per-test testing mode and reset of the shared task store and response cache
+- Pre-created task for tests that operate on an existing task
+- Per-test TaskManager instance
+- Pre-populated TaskManager in a chosen starting state
+"""
+
+from typing import Any, Dict
+
+import pytest
+from flask import Flask
+from flask.testing import FlaskClient
+
+from app import create_app, TaskManager
+
+# Number of tasks created by the tm fixture for each starting state
+_TM_STATES = {'empty': 0, 'one': 1, 'two': 2}
+
+# Request payload for created_task, built once per test session
+_BASIC_TASK = {'title': 'Test Task'}
+
+@pytest.fixture(scope="session")
+def app() -> Flask:
+    """
+    Create the Flask application once for the whole test session.
+
+    Testing mode is switched on per test by _reset_app_state, so no test
+    can leave configuration changes behind on the shared application.
+
+    Returns:
+        Flask application shared by the API tests
+    """
+    return create_app()
+
+@pytest.fixture(scope="session")
+def client(app: Flask) -> FlaskClient:
+    """
+    Create the Flask test client once for the whole test session.
+
+    Returns:
+        Flask test client for the session application
+    """
+    return app.test_client()
+
+@pytest.fixture(autouse=True)
+def _reset_app_state(request: pytest.FixtureRequest) -> None:
+    """
+    Reset shared application state before each test that uses the app.
+
+    Enables testing mode through monkeypatch so it is undone after the test,
+    empties the shared TaskManager, restarts ID assignment and clears cached
+    responses so every test starts from a clean slate. Pure TaskManager unit
+    tests never touch the app and skip this entirely.
+    """
+    if 'app' not in request.fixturenames:
+        return
+    app = request.getfixturevalue('app')
+    request.getfixturevalue('monkeypatch').setitem(app.config, 'TESTING', True)
+    task_manager = app.extensions['task_manager']
+    task_manager.tasks.clear()
+    task_manager.task_id_counter = 1
+    for cache_backend in app.extensions['cache'].values():
+        cache_backend.clear()
+
+@pytest.fixture
+def created_task(client: FlaskClient) -> Dict[str, Any]:
+    """
+    Create a task through the API for tests that act on an existing task.
+
+    Returns:
+        Dict containing the created task data
+    """
+    response = client.post('/tasks', json=_BASIC_TASK)
+    return response.json['task']
+
+@pytest.fixture
+def task_manager() -> TaskManager:
+    """
+    Provide a fresh TaskManager for each unit test.
+
+    Returns:
+        TaskManager with an empty task store
+    """
+    return TaskManager()
+
+@pytest.fixture(params=list(_TM_STATES))
+def tm(request: pytest.FixtureRequest) -> TaskManager:
+    """
+    Provide a TaskManager pre-populated with "Task 1", "Task 2", ...
+
+    Tests pick their starting state with
+    @pytest.mark.parametrize("tm", ["one"], indirect=True); without it the
+    test runs once for every state in _TM_STATES.
+
+    Returns:
+        TaskManager holding the number of tasks named by request.param
+    """
+    manager = TaskManager()
+    for i in range(_TM_STATES[request.param]):
+        manager.create_task(f"Task {i + 1}")
+    return manager
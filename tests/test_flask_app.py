@@ -0,0 +1,355 @@
+"""
+Task Management System - Flask API Integration Tests
+----------------------------------------------------
+
+Integration tests for the Flask REST API endpoints.
+
+Author: Uttam Thakur
+Version: 1.0.0
+License: MIT
+Created: 2025
+Updated: 2025
+
+Usage:
+    python -m pytest
+    python -m tests.test_flask_app
+
+This module provides:
+- Request/response cycle tests
+- Status code and response format checks
+- Error handling and edge case coverage
+- Response cache invalidation tests
+"""
+
+import re
+from typing import Dict, Any
+
+import pytest
+from flask import Flask
+from flask.testing import FlaskClient
+
+BASE_URL = '/tasks'
+
+# Fixed request payloads, built once per test session
+_API_TASK = {'title': 'Test API Task', 'description': 'Test description'}
+_COMPLETE = {'status': 'completed'}
+_INVALID = {'status': 'invalid_status'}
+
+_NOT_FOUND_RE = re.compile(r'not found', re.I)
+
+def create_test_task(
+    client: FlaskClient,
+    title: str = "Test Task",
+    description: str = ""
+) -> Dict[str, Any]:
+    """
+    Helper to create a test task.
+    
+    Args:
+        title: Task title (default: "Test Task")
+        description: Task description (default: "")
+        
+    Returns:
+        Dict containing the created task data
+    """
+    task_data = {
+        'title': title,
+        'description': description
+    }
+    response = client.post(
+        BASE_URL,
+        json=task_data
+    )
+    return response.json
+
+def test_health_check_endpoint(client: FlaskClient) -> None:
+    """
+    Verify health check endpoint functionality.
+    
+    Ensures:
+    - 200 status code
+    - Correct response format
+    - Required fields present
+    - Version information
+    """
+    response = client.get('/health')
+    assert response.status_code == 200
+    
+    data = dict(response.json)
+    assert data.keys() == {'status', 'timestamp', 'version', 'environment'}
+    del data['timestamp'], data['environment']
+    assert data == {'status': 'healthy', 'version': '1.0.0'}
+
+def test_get_tasks_empty(client: FlaskClient) -> None:
+    """
+    Verify get tasks endpoint with empty task list.
+    
+    Ensures:
+    - 200 status code
+    - Empty task list
+    - Correct count
+    - Success indicator
+    """
+    response = client.get(BASE_URL)
+    assert response.status_code == 200
+    
+    assert response.json == {'success': True, 'tasks': [], 'count': 0, 'total': 0}
+
+def test_get_tasks_paginated(client: FlaskClient) -> None:
+    """
+    Verify pagination query parameters on the task list endpoint.
+    
+    Ensures:
+    - limit/offset select the requested window
+    - total reports the full task count
+    - Limits beyond sys.maxsize are accepted
+    - Invalid values return 400
+    """
+    for i in range(1, 4):
+        create_test_task(client, f"Task {i}")
+    
+    response = client.get(f'{BASE_URL}?limit=1&offset=1')
+    assert response.status_code == 200
+    data = response.json
+    assert data['count'] == 1
+    assert data['total'] == 3
+    assert data['tasks'][0]['title'] == 'Task 2'
+    
+    response = client.get(f'{BASE_URL}?limit={10 ** 30}&offset=1')
+    assert response.status_code == 200
+    assert response.json['count'] == 2
+    
+    for query in ('limit=abc', 'offset=-1'):
+        response = client.get(f'{BASE_URL}?{query}')
+        assert response.status_code == 400
+
+def test_create_task_success(client: FlaskClient):
+    """Test Case 15: Create task via API with valid data"""
+    response = client.post('/tasks', json=_API_TASK)
+    
+    assert response.status_code == 201
+    data = response.json
+    assert data['success']
+    assert data['task']['title'] == _API_TASK['title']
+
+def test_get_specific_task_success(client: FlaskClient, created_task: Dict[str, Any]):
+    """Test Case 18: Get specific task by ID via API"""
+    response = client.get(f"/tasks/{created_task['id']}")
+    assert response.status_code == 200
+    
+    data = response.json
+    assert data['success']
+    assert data['task']['id'] == created_task['id']
+
+@pytest.mark.parametrize("method, path, request_kwargs", [
+    ('get', '/tasks/999', {}),
+    ('put', '/tasks/999/status', {'json': _COMPLETE}),
+    ('delete', '/tasks/999', {}),
+], ids=["get", "update-status", "delete"])
+def test_missing_task_returns_not_found(client: FlaskClient, method: str, path: str,
+                                        request_kwargs: Dict[str, Any]) -> None:
+    """Verify task-specific endpoints return 404 for a non-existing task ID."""
+    response = getattr(client, method)(path, **request_kwargs)
+    assert response.status_code == 404
+    
+    data = response.json
+    assert not data['success']
+    assert data['error'] == 'Task not found'
+
+def test_update_task_status_success(client: FlaskClient, created_task: Dict[str, Any]):
+    """Test Case 20: Update task status via API"""
+    response = client.put(f"/tasks/{created_task['id']}/status", json=_COMPLETE)
+    
+    assert response.status_code == 200
+    data = response.json
+    assert data['success']
+    assert data['task']['status'] == 'completed'
+
+def test_update_task_status_invalid(client: FlaskClient, created_task: Dict[str, Any]):
+    """Test Case 21: Update task with invalid status"""
+    response = client.put(f"/tasks/{created_task['id']}/status", json=_INVALID)
+    
+    assert response.status_code == 400
+    data = response.json
+    assert not data['success']
+    
+    for body in ('status', ['status']):
+        response = client.put(f"/tasks/{created_task['id']}/status", json=body)
+        assert response.status_code == 400
+        assert response.json['error'] == 'Request body must be a JSON object'
+
+def test_delete_task_success(client: FlaskClient, created_task: Dict[str, Any]):
+    """Test Case 22: Delete task via API"""
+    response = client.delete(f"/tasks/{created_task['id']}")
+    assert response.status_code == 200
+    
+    data = response.json
+    assert data['success']
+
+def test_invalid_endpoint(client: FlaskClient):
+    """Test Case 24: Access invalid endpoint returns 404"""
+    response = client.get('/invalid-endpoint')
+    assert response.status_code == 404
+    
+    data = response.json
+    assert not data['success']
+    assert _NOT_FOUND_RE.search(data['error'])
+
+def test_malformed_json_returns_bad_request(client: FlaskClient) -> None:
+    """Verify an unparseable JSON body is reported as a JSON 400."""
+    response = client.post(
+        BASE_URL,
+        data='{not json',
+        content_type='application/json'
+    )
+    assert response.status_code == 400
+    assert not response.json['success']
+
+def test_method_not_allowed_keeps_allow_header(client: FlaskClient) -> None:
+    """Verify a wrong method is a JSON 405 that still lists allowed methods."""
+    response = client.post(f'{BASE_URL}/1')
+    assert response.status_code == 405
+    assert response.content_type == 'application/json'
+    assert set(response.allow) == {'GET', 'HEAD', 'OPTIONS', 'DELETE'}
+    assert not response.json['success']
+
+def test_unhandled_error_returns_internal_server_error(
+    app: Flask,
+    client: FlaskClient,
+    monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Verify unexpected exceptions are reported as a JSON 500."""
+    def failing_get_all_tasks(*args: Any, **kwargs: Any) -> None:
+        raise RuntimeError("simulated failure")
+    
+    monkeypatch.setattr(app.extensions['task_manager'], 'get_all_tasks', failing_get_all_tasks)
+    response = client.get(BASE_URL)
+    
+    assert response.status_code == 500
+    assert response.json == {
+        'success': False,
+        'error': 'Internal server error'
+    }
+
+@pytest.mark.parametrize("request_kwargs", [
+    {},
+    {'json': {}},
+    {'json': {'title': ''}},
+    {'json': {'title': 123}},
+    {'json': {'title': 'Task', 'description': None}},
+    {'json': {'title': 'Task', 'description': 5}},
+    {'json': [1, 2]},
+    {'json': 'title'},
+    {'data': 'not json'},
+], ids=["no-body", "missing-title", "empty-title", "non-string-title",
+        "null-description", "non-string-description", "array-body", "string-body",
+        "not-json"])
+def test_create_task_validation(client: FlaskClient, request_kwargs: Dict[str, Any]) -> None:
+    """
+    Verify task creation input validation.
+    
+    Tests:
+    - Missing request body
+    - Missing title
+    - Empty title
+    - Non-string title
+    - Null or non-string description
+    - Non-object JSON bodies
+    - Invalid content type
+    """
+    response = client.post(BASE_URL, **request_kwargs)
+    assert response.status_code == 400
+    
+    data = response.json
+    assert not data['success']
+    assert 'error' in data
+
+def test_task_lifecycle(client: FlaskClient, created_task: Dict[str, Any]) -> None:
+    """
+    Verify complete task lifecycle through API.
+    
+    Tests sequence:
+    1. Create task (created_task fixture)
+    2. Retrieve task
+    3. Update task status
+    4. Delete task
+    5. Verify deletion
+    """
+    assert created_task['status'] == 'pending'
+    task_id = created_task['id']
+    
+    # Update status
+    update_response = client.put(
+        f'{BASE_URL}/{task_id}/status',
+        json=_COMPLETE
+    )
+    assert update_response.status_code == 200
+    
+    # Delete task
+    delete_response = client.delete(f'{BASE_URL}/{task_id}')
+    assert delete_response.status_code == 200
+    
+    # Verify deletion
+    get_response = client.get(f'{BASE_URL}/{task_id}')
+    assert get_response.status_code == 404
+
+def test_create_tasks_batch_endpoint(client: FlaskClient) -> None:
+    """
+    Verify batch task creation endpoint.
+    
+    Ensures:
+    - 201 status code with all created tasks
+    - Created tasks are visible in the task list
+    - Invalid batches and non-object bodies return 400
+    """
+    response = client.post(
+        f'{BASE_URL}/batch',
+        json={'tasks': [{'title': 'Task 1'}, {'title': 'Task 2'}]}
+    )
+    assert response.status_code == 201
+    data = response.json
+    assert data['success']
+    assert data['count'] == 2
+    assert client.get(BASE_URL).json['count'] == 2
+    
+    response = client.post(
+        f'{BASE_URL}/batch',
+        json={'tasks': [{'title': ''}]}
+    )
+    assert response.status_code == 400
+    assert not response.json['success']
+    
+    for body in ([{'title': 'Task 3'}], 'Task 3'):
+        response = client.post(f'{BASE_URL}/batch', json=body)
+        assert response.status_code == 400
+        assert response.json['error'] == 'Request body must be a JSON object'
+
+def test_cached_reads_invalidated_on_mutation(client: FlaskClient) -> None:
+    """
+    Verify cached GET responses are refreshed after writes.
+    
+    Ensures:
+    - Task list reflects newly created tasks
+    - Cached 404 for a task ID is dropped once it is created
+    - Status updates and deletions are visible immediately
+    """
+    assert client.get(BASE_URL).json['count'] == 0
+    assert client.get(f'{BASE_URL}/1').status_code == 404
+    
+    create_test_task(client)
+    assert client.get(BASE_URL).json['count'] == 1
+    assert client.get(f'{BASE_URL}/1').status_code == 200
+    
+    client.put(
+        f'{BASE_URL}/1/status',
+        json=_COMPLETE
+    )
+    data = client.get(f'{BASE_URL}/1').json
+    assert data['task']['status'] == 'completed'
+    
+    client.delete(f'{BASE_URL}/1')
+    assert client.get(f'{BASE_URL}/1').status_code == 404
+    assert client.get(BASE_URL).json['count'] == 0
+
+if __name__ == '__main__':
+    raise SystemExit(pytest.main([__file__, "-q"]))
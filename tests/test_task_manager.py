@@ -0,0 +1,266 @@
+"""
+Task Management System - TaskManager Unit Tests
+-----------------------------------------------
+
+Unit tests for the TaskManager core logic. Only TaskManager is imported here.
+
+Author: Uttam Thakur
+Version: 1.0.0
+License: MIT
+Created: 2025
+Updated: 2025
+
+Usage:
+    python -m pytest
+    python -m tests.test_task_manager
+
+This module provides:
+- Task creation, retrieval, update and deletion tests
+- Validation and error condition tests
+- Pagination and locking tests
+"""
+
+import re
+from typing import Any
+from datetime import datetime
+
+import pytest
+
+from app import TaskManager
+
+_NON_EMPTY_RE = re.compile(r"non-empty string")
+
+class TestReadOnlyQueries:
+    """
+    Queries that never mutate the store, sharing a single TaskManager.
+    
+    The manager is built once per class and must stay empty, so tests in
+    this group may only query or target task IDs that do not exist.
+    """
+    
+    @pytest.fixture(scope="class")
+    def tm(self) -> TaskManager:
+        """
+        Create one TaskManager for the whole class.
+        
+        Returns:
+            Empty TaskManager shared by the read-only tests
+        """
+        return TaskManager()
+    
+    def test_task_manager_initialization(self, tm: TaskManager) -> None:
+        """
+        Verify TaskManager initializes with correct default state.
+        
+        Ensures:
+        - Empty task list
+        - Counter starts at 1
+        - No residual state
+        """
+        assert (len(tm.tasks), tm.task_id_counter) == (0, 1)
+    
+    def test_get_task_not_found(self, tm: TaskManager):
+        """Test Case 6: Retrieve non-existing task returns None"""
+        task = tm.get_task(999)
+        assert task is None
+    
+    def test_update_task_status_not_found(self, tm: TaskManager):
+        """Test Case 10: Update non-existing task returns None"""
+        result = tm.update_task_status(999, 'completed')
+        assert result is None
+    
+    def test_delete_task_not_found(self, tm: TaskManager):
+        """Test Case 12: Delete non-existing task returns False"""
+        result = tm.delete_task(999)
+        assert not result
+
+def test_create_task_success(task_manager: TaskManager) -> None:
+    """
+    Verify successful task creation with valid data.
+    
+    Tests:
+    - Task creation with title and description
+    - Correct ID assignment
+    - Default status
+    - Timestamp presence
+    """
+    task = task_manager.create_task("Test Task", "Test Description")
+    
+    assert len(task_manager.tasks) == 1
+    
+    task = dict(task)
+    created_at, updated_at = task.pop('created_at'), task.pop('updated_at')
+    assert created_at == updated_at
+    assert isinstance(datetime.fromisoformat(created_at), datetime)
+    assert task == {
+        'id': 1,
+        'title': "Test Task",
+        'description': "Test Description",
+        'status': 'pending'
+    }
+
+@pytest.mark.parametrize("title", ["", None, 123, []], ids=["empty", "none", "int", "list"])
+def test_create_task_invalid_title(task_manager: TaskManager, title: Any) -> None:
+    """
+    Verify task creation fails for empty or non-string titles.
+    
+    Tests:
+    - Empty string and None titles
+    - Non-string title types
+    - Error message clarity
+    """
+    with pytest.raises(ValueError, match=_NON_EMPTY_RE):
+        task_manager.create_task(title)
+
+@pytest.mark.parametrize("description", [None, 5], ids=["none", "int"])
+def test_create_task_invalid_description(task_manager: TaskManager, description: Any) -> None:
+    """
+    Verify single and batch creation reject non-string descriptions.
+    
+    Tests:
+    - Both creation paths raise ValueError
+    - Nothing is stored
+    """
+    with pytest.raises(ValueError, match="must be a string"):
+        task_manager.create_task("Task 1", description)
+    
+    with pytest.raises(ValueError, match="must be a string"):
+        task_manager.create_tasks([{'title': "Task 1", 'description': description}])
+    
+    assert len(task_manager.tasks) == 0
+
+def test_create_tasks_batch(task_manager: TaskManager) -> None:
+    """
+    Verify batch creation of tasks.
+    
+    Tests:
+    - Sequential ID assignment in input order
+    - Shared timestamp across the batch
+    - All tasks stored
+    """
+    tasks = task_manager.create_tasks([
+        {'title': "Task 1", 'description': "First"},
+        {'title': "Task 2"}
+    ])
+    
+    assert [task['id'] for task in tasks] == [1, 2]
+    assert tasks[0]['created_at'] == tasks[1]['created_at']
+    assert tasks[1]['description'] == ""
+    assert len(task_manager.tasks) == 2
+
+def test_create_tasks_batch_invalid(task_manager: TaskManager) -> None:
+    """
+    Verify an invalid batch is rejected without storing any task.
+    
+    Tests:
+    - Empty or non-list batch
+    - One invalid entry rejects the whole batch
+    """
+    with pytest.raises(ValueError, match="non-empty list"):
+        task_manager.create_tasks([])
+    
+    with pytest.raises(ValueError, match="non-empty list"):
+        task_manager.create_tasks({'title': "Task 1"})
+    
+    with pytest.raises(ValueError, match=_NON_EMPTY_RE):
+        task_manager.create_tasks([{'title': "Task 1"}, {'title': ""}])
+    
+    assert len(task_manager.tasks) == 0
+    assert task_manager.task_id_counter == 1
+
+def test_mutations_hold_lock(task_manager: TaskManager, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Verify the store is only mutated while the TaskManager lock is held.
+    
+    Tests:
+    - Single and batch creation add tasks under the lock
+    - Deletion pops the task under the lock
+    """
+    lock_held = []
+    add_task = task_manager._add_task
+    
+    def checked_add_task(*args: Any) -> Any:
+        lock_held.append(task_manager._lock.locked())
+        return add_task(*args)
+    
+    class CheckedStore(dict):
+        def pop(self, *args: Any) -> Any:
+            lock_held.append(task_manager._lock.locked())
+            return super().pop(*args)
+    
+    monkeypatch.setattr(task_manager, '_add_task', checked_add_task)
+    monkeypatch.setattr(task_manager, 'tasks', CheckedStore())
+    
+    task_manager.create_task("Task 1")
+    task_manager.create_tasks([{'title': "Task 2"}, {'title': "Task 3"}])
+    assert task_manager.delete_task(1)
+    
+    assert lock_held == [True] * 4
+
+@pytest.mark.parametrize("tm", ["one"], indirect=True)
+def test_get_task_success(tm: TaskManager):
+    """Test Case 5: Retrieve existing task by ID"""
+    retrieved_task = tm.get_task(1)
+    
+    assert retrieved_task is not None
+    assert retrieved_task['id'] == 1
+    assert retrieved_task['title'] == "Task 1"
+
+def test_get_all_tasks(tm: TaskManager):
+    """Test Case 7: Retrieve all tasks in every starting state"""
+    all_tasks = tm.get_all_tasks()
+    expected_titles = [f"Task {i}" for i in range(1, len(tm.tasks) + 1)]
+    assert [task['title'] for task in all_tasks] == expected_titles
+
+def test_get_all_tasks_paginated(task_manager: TaskManager) -> None:
+    """
+    Verify paginated task retrieval.
+    
+    Tests:
+    - Limit and offset select a window in creation order
+    - Offset past the end returns an empty list
+    - Bounds beyond sys.maxsize are clamped rather than rejected
+    - Negative values are rejected
+    """
+    for i in range(1, 6):
+        task_manager.create_task(f"Task {i}")
+    
+    page = task_manager.get_all_tasks(limit=2, offset=1)
+    assert [task['title'] for task in page] == ["Task 2", "Task 3"]
+    assert len(task_manager.get_all_tasks(offset=3)) == 2
+    assert task_manager.get_all_tasks(offset=10) == []
+    assert len(task_manager.get_all_tasks(limit=10 ** 30, offset=2)) == 3
+    assert task_manager.get_all_tasks(offset=10 ** 30) == []
+    
+    with pytest.raises(ValueError, match="non-negative"):
+        task_manager.get_all_tasks(limit=-1)
+
+@pytest.mark.parametrize("tm", ["one"], indirect=True)
+def test_update_task_status_success(tm: TaskManager):
+    """Test Case 8: Update task status with valid status"""
+    updated_task = tm.update_task_status(1, 'completed')
+    
+    assert updated_task is not None
+    assert updated_task['status'] == 'completed'
+
+@pytest.mark.parametrize("tm", ["one"], indirect=True)
+def test_update_task_status_invalid_status(tm: TaskManager):
+    """Test Case 9: Update task with invalid status should raise ValueError"""
+    with pytest.raises(ValueError, match="Status must be one of"):
+        tm.update_task_status(1, 'invalid_status')
+    
+    with pytest.raises(ValueError, match="Status must be one of"):
+        tm.update_task_status(1, ['completed'])
+
+@pytest.mark.parametrize("tm", ["one", "two"], indirect=True)
+def test_delete_task_success(tm: TaskManager):
+    """Test Case 11: Delete existing task"""
+    remaining = len(tm.tasks) - 1
+    result = tm.delete_task(1)
+    
+    assert result
+    assert len(tm.tasks) == remaining
+    assert tm.get_task(1) is None
+
+if __name__ == '__main__':
+    raise SystemExit(pytest.main([__file__, "-q"]))